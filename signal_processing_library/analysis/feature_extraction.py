@@ -1,25 +1,175 @@
+from functools import lru_cache
+from importlib.util import find_spec
 import numpy as np
-from scipy.signal import find_peaks, lfilter
-from scipy.fftpack import fft
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import resample_poly
+from scipy import fft as sfft
 import librosa
+from transformations.fft import compute_fft
 
+# torchaudio is optional and slow to import, so it is only imported on first MFCC use
+_HAVE_TORCHAUDIO = find_spec('torchaudio') is not None
+# numba is optional too and only imported the first time pitch is calculated
+_HAVE_NUMBA = find_spec('numba') is not None
 
-def calculate_pitch(signal, sampling_rate):
+# Set-bit count of every byte value, for NumPy versions without np.bitwise_count
+_POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+# _LEADING_BITS_MASK[k] keeps the k most significant bits of a byte
+_LEADING_BITS_MASK = np.array([(0xFF << (8 - k)) & 0xFF for k in range(8)], dtype=np.uint8)
+
+# Stretch factors pruned from the autocorrelation by the enhanced SACF pitch detector
+_ESACF_FACTORS = (2, 3, 5, 7, 11)
+# The shortest period whose peak reaches this fraction of the strongest one is taken as the pitch.
+# Peaks at 13, 17, ... times the period survive the pruning, and one of them can land exactly on a
+# sample while the fundamental's peak falls between two, so the strongest peak alone isn't reliable
+_ESACF_PEAK_RATIO = 0.7
+
+
+def _frame_signal(signal, frame_size, hop_size):
+    """
+    Split a signal into overlapping frames without copying
+
+    Args:
+        signal (ndarray): the input signal
+        frame_size (int): size of each frame in samples
+        hop_size (int): step size between frames in samples
+
+    Returns:
+        ndarray: read-only (n_frames, frame_size) view over the signal
+    """
+    n_frames = len(range(0, len(signal) - frame_size, hop_size))
+    if n_frames == 0:
+        return np.empty((0, frame_size), dtype=signal.dtype)
+    return sliding_window_view(signal, frame_size)[::hop_size][:n_frames]
+
+
+def _esacf_lag_numpy(corr, min_lag, max_lag):
+    """
+    Lag of the fundamental's enhanced-autocorrelation peak, using NumPy array operations
+
+    Args:
+        corr (ndarray): autocorrelation of the signal for lags 0..N-1
+        min_lag (int): shortest period to search, in samples (at least 1)
+        max_lag (int): longest period to search, in samples
+
+    Returns:
+        int: lag of the fundamental period in samples (0 if none was found)
+    """
+    # Stretched copies only read lower lags, so nothing past max_lag is needed
+    enhanced = np.maximum(corr[:max_lag + 1], 0)
+    stretched_index = np.arange(len(enhanced))
+    for factor in _ESACF_FACTORS:
+        enhanced = np.maximum(enhanced - enhanced[stretched_index // factor], 0)
+    if min_lag >= len(enhanced):
+        return 0
+    peak = enhanced[min_lag:].max()
+    if peak <= 0:
+        return 0
+    lag = min_lag + int(np.argmax(enhanced[min_lag:] >= _ESACF_PEAK_RATIO * peak))
+    while lag + 1 < len(enhanced) and enhanced[lag + 1] > enhanced[lag]:  # Climb to the top of that peak
+        lag += 1
+    return lag
+
+
+def _esacf_lag_loop(corr, min_lag, max_lag):
+    """
+    Lag of the fundamental's enhanced-autocorrelation peak, using explicit loops over one scratch buffer
+
+    Compiled with numba when available. Gives the same result as _esacf_lag_numpy.
+
+    Args:
+        corr (ndarray): autocorrelation of the signal for lags 0..N-1
+        min_lag (int): shortest period to search, in samples (at least 1)
+        max_lag (int): longest period to search, in samples
+
+    Returns:
+        int: lag of the fundamental period in samples (0 if none was found)
+    """
+    n = min(len(corr), max_lag + 1)
+    enhanced = np.empty(n)
+    for i in range(n):
+        enhanced[i] = corr[i] if corr[i] > 0 else 0.0
+    for factor in _ESACF_FACTORS:
+        # Walk lags downwards so enhanced[i // factor] still holds this pass's input.
+        # Lag 0 is included (and so cleared) like in the NumPy version; otherwise the
+        # zero-lag energy would wipe out every lag below the current factor.
+        for i in range(n - 1, -1, -1):
+            value = enhanced[i] - enhanced[i // factor]
+            enhanced[i] = value if value > 0 else 0.0
+    peak = 0.0
+    for i in range(min_lag, n):
+        if enhanced[i] > peak:
+            peak = enhanced[i]
+    if peak <= 0:
+        return 0
+    lag = min_lag
+    while enhanced[lag] < _ESACF_PEAK_RATIO * peak:
+        lag += 1
+    while lag + 1 < n and enhanced[lag + 1] > enhanced[lag]:  # Climb to the top of that peak
+        lag += 1
+    return lag
+
+
+@lru_cache(maxsize=1)
+def _esacf_lag_function():
+    """
+    Pick the ESACF peak search, compiling the loop version with numba on first use
+
+    Returns:
+        callable: _esacf_lag_loop compiled with numba, or _esacf_lag_numpy without it
+    """
+    if not _HAVE_NUMBA:
+        return _esacf_lag_numpy
+    from numba import njit
+
+    return njit(fastmath=True, cache=True)(_esacf_lag_loop)
+
+
+def _popcount(values):
+    """
+    Count the set bits of each byte
+
+    Args:
+        values (ndarray): uint8 array
+
+    Returns:
+        ndarray: number of set bits per element
+    """
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return np.bitwise_count(values)
+    return _POPCOUNT_TABLE[values]
+
+
+def calculate_pitch(signal, sampling_rate, fmin=50, fmax=2000):
     """
-    Calculate the pitch of a signal using auto- correlation
+    Calculate the pitch of a signal using the enhanced summary autocorrelation (ESACF)
+
+    The autocorrelation is half-wave rectified, then copies time-stretched by
+    small prime factors are subtracted to cancel peaks at multiples of the
+    period, leaving the fundamental as the strongest peak (Tolonen & Karjalainen).
+    Only periods between 1/fmax and 1/fmin are searched, and the shortest period
+    with a peak close to the strongest one is taken, since the pruning does not
+    reach multiples of the period beyond the largest stretch factor.
 
     Args:
         signal (ndarray): the input signal
         sampling_rate (int): sampling rate of the signal
+        fmin (float): lowest pitch to detect in Hz
+        fmax (float): highest pitch to detect in Hz
 
     Returns:
-        float: fundamental frequency (pitch) in Hz
+        float: fundamental frequency (pitch) in Hz (0.0 if none was found)
     """
-    corr = np.correlate(signal, signal, mode='full')
-    corr = corr[len(corr) // 2:]
-    peaks, _ = find_peaks(corr)
-    if len(peaks) > 1:
-        lag = peaks[1]
+    # Autocorrelation via FFT (Wiener-Khinchin), zero-padded to avoid circular wrap
+    n_fft = sfft.next_fast_len(2 * len(signal) - 1, real=True)
+    spectrum = sfft.rfft(signal - signal.mean(), n=n_fft)
+    corr = sfft.irfft(spectrum * np.conj(spectrum), n=n_fft)[:len(signal)]
+    min_lag = max(1, int(np.ceil(sampling_rate / fmax)))
+    max_lag = min(len(corr) - 1, int(sampling_rate // fmin))
+    if min_lag > max_lag:
+        return 0.0
+    lag = _esacf_lag_function()(corr, min_lag, max_lag)
+    if lag > 0:
         pitch = sampling_rate / lag
         return pitch
     return 0.0
@@ -37,11 +187,25 @@ def short_term_energy(signal, frame_size, hop_size):
     Returns:
         ndarray: array of energy values for each frame
     """
-    energy = []
-    for start in range(0, len(signal) - frame_size, hop_size):
-        frame = signal[start:start + frame_size]
-        energy.append(np.sum(frame ** 2))
-    return np.array(energy)
+    frames = _frame_signal(signal, frame_size, hop_size)
+    # Batched per-frame dot products; accumulate in float64 so int16 PCM cannot overflow
+    return np.einsum('ij,ij->i', frames, frames, dtype=np.float64)
+
+
+def _mean_power(signal):
+    """
+    Mean of the squared samples, computed as an inner product
+
+    Args:
+        signal (ndarray): 1D signal
+
+    Returns:
+        float: mean power of the signal
+    """
+    if not np.issubdtype(signal.dtype, np.floating):
+        # Integer PCM would overflow when squared; float input is used as-is (no copy)
+        signal = signal.astype(np.float64)
+    return float(np.dot(signal, signal)) / signal.size
 
 
 def compute_snr(signal, noise):
@@ -57,13 +221,13 @@ def compute_snr(signal, noise):
     """
     # Ensure the signal and noise are mono (collapse stereo to mono if needed)
     if signal.ndim > 1:
-        signal = np.mean(signal, axis=0)  # Collapse to mono
+        signal = np.mean(signal, axis=1)  # Collapse (samples, channels) to mono
     if noise.ndim > 1:
-        noise = np.mean(noise, axis=0)  # Collapse to mono
+        noise = np.mean(noise, axis=1)  # Collapse (samples, channels) to mono
 
-    # Compute signal and noise power
-    signal_power = np.mean(signal ** 2)
-    noise_power = np.mean(noise ** 2)
+    # Compute signal and noise power as inner products, without squared temporaries
+    signal_power = _mean_power(signal)
+    noise_power = _mean_power(noise)
 
     # Check to prevent division by zero
     if noise_power == 0:
@@ -84,31 +248,51 @@ def zero_crossing_rate(signal, frame_size, hop_size):
     Returns:
         ndarray: array of ZCR values for each frame
     """
-    zcr = []
-    for start in range(0, len(signal) - frame_size, hop_size):
-        frame = signal[start:start + frame_size]
-        zcr.append(((frame[:-1] * frame[1:]) < 0).sum() / frame_size)
-    return np.array(zcr)
-
-
-def spectral_centroid(signal, sampling_rate):
+    n_frames = len(range(0, len(signal) - frame_size, hop_size))
+    if n_frames == 0:
+        return np.empty(0)
+
+    # Pack the sign bits 8 samples per byte (MSB first), then XOR each byte with itself
+    # shifted left by one sample so bit i flags a sign flip between samples i and i + 1
+    signs = np.packbits(np.signbit(signal))
+    next_signs = signs << 1
+    next_signs[:-1] |= signs[1:] >> 7
+    crossings = signs ^ next_signs
+    # crossings_before_byte[k] = number of sign flips in the first k bytes (8 * k pairs)
+    crossings_before_byte = np.zeros(len(crossings) + 1, dtype=np.int64)
+    np.cumsum(_popcount(crossings), out=crossings_before_byte[1:])
+
+    def crossings_before(pair_index):
+        byte, bit = np.divmod(pair_index, 8)
+        partial = _popcount(crossings[byte] & _LEADING_BITS_MASK[bit])
+        return crossings_before_byte[byte] + partial
+
+    # Frame f covers the pairs [start, start + frame_size - 1)
+    starts = np.arange(n_frames) * hop_size
+    counts = crossings_before(starts + frame_size - 1) - crossings_before(starts)
+    return counts / frame_size
+
+
+def spectral_centroid(signal, sampling_rate, spectrum=None):
     """
     Calculate the spectral centroid of the signal
 
     Args:
         signal (ndarray): the input signal
         sampling_rate (int): sampling rate of the signal
+        spectrum (tuple): optional (frequencies, magnitudes) from compute_fft, to reuse one FFT
 
     Returns:
         float: spectral centroid in Hz
     """
-    magnitude_spectrum = np.abs(np.fft.rfft(signal))
-    frequencies = np.fft.rfftfreq(len(signal), d=1/sampling_rate)
+    if spectrum is None:
+        spectrum = compute_fft(signal, sampling_rate)
+    frequencies, magnitude_spectrum = spectrum
     centroid = np.sum(frequencies * magnitude_spectrum) / np.sum(magnitude_spectrum)
     return centroid
 
 
-def spectral_rolloff(signal, sampling_rate, rolloff_percent=0.85):
+def spectral_rolloff(signal, sampling_rate, rolloff_percent=0.85, spectrum=None):
     """
     Calculate the spectral rolloff of the signal
 
@@ -116,20 +300,53 @@ def spectral_rolloff(signal, sampling_rate, rolloff_percent=0.85):
         signal (ndarray): the input signal
         sampling_rate (int): sampling rate of the signal
         rolloff_percent (float): percentage of spectral energy (default 85%)
+        spectrum (tuple): optional (frequencies, magnitudes) from compute_fft, to reuse one FFT
 
     Returns:
         float: spectral rolloff frequency in Hz
     """
-    magnitude_spectrum = np.abs(np.fft.rfft(signal))
+    if spectrum is None:
+        spectrum = compute_fft(signal, sampling_rate)
+    frequencies, magnitude_spectrum = spectrum
     total_energy = np.sum(magnitude_spectrum)
     cumulative_energy = np.cumsum(magnitude_spectrum)
-    rolloff_index = np.where(cumulative_energy >= rolloff_percent * total_energy)[0][0]
-    frequencies = np.fft.rfftfreq(len(signal), d=1/sampling_rate)
+    # The cumulative sum is non-decreasing, so binary search finds the first bin past the threshold
+    rolloff_index = np.searchsorted(cumulative_energy, rolloff_percent * total_energy)
     rolloff = frequencies[rolloff_index]
     return rolloff
 
 
-def compute_mfcc(signal, sampling_rate, n_mfcc=13):
+@lru_cache(maxsize=8)
+def _mfcc_transform(sampling_rate, n_mfcc, n_fft=2048, hop_length=512):
+    """
+    Build a torchaudio MFCC transform matching librosa's defaults, reused across calls
+
+    Args:
+        sampling_rate (int): sampling rate of the signal
+        n_mfcc (int): number of MFCCs to compute
+        n_fft (int): FFT window size
+        hop_length (int): hop size between frames
+
+    Returns:
+        torchaudio.transforms.MFCC: transform with a precomputed mel filterbank
+    """
+    import torchaudio
+
+    return torchaudio.transforms.MFCC(
+        sample_rate=sampling_rate,
+        n_mfcc=n_mfcc,
+        melkwargs={
+            'n_fft': n_fft,
+            'hop_length': hop_length,
+            'n_mels': 128,
+            'mel_scale': 'slaney',
+            'norm': 'slaney',
+            'pad_mode': 'constant',
+        },
+    )
+
+
+def compute_mfcc(signal, sampling_rate, n_mfcc=13, backend='auto'):
     """
     Compute MFCCs of the signal
 
@@ -137,10 +354,24 @@ def compute_mfcc(signal, sampling_rate, n_mfcc=13):
         signal (ndarray): the input signal
         sampling_rate (int): sampling rate of the signal
         n_mfcc (int): number of MFCCs to compute
+        backend (str): 'torchaudio', 'librosa', or 'auto' to use torchaudio when installed
 
     Returns:
         ndarray: Computed MFCCs.
     """
+    if backend not in ('auto', 'torchaudio', 'librosa'):
+        raise ValueError(f"Unsupported MFCC backend '{backend}'. Supported backends are 'auto', 'torchaudio' and 'librosa'.")
+    if backend == 'torchaudio' and not _HAVE_TORCHAUDIO:
+        raise ImportError("The 'torchaudio' MFCC backend requires torchaudio to be installed.")
+
+    if backend != 'librosa' and _HAVE_TORCHAUDIO:
+        import torch
+
+        transform = _mfcc_transform(int(sampling_rate), n_mfcc)
+        with torch.no_grad():
+            mfccs = transform(torch.from_numpy(np.ascontiguousarray(signal, dtype=np.float32)))
+        return mfccs.numpy()
+
     mfccs = librosa.feature.mfcc(y=signal, sr=sampling_rate, n_mfcc=n_mfcc)
     return mfccs
 
@@ -157,7 +388,8 @@ def formant_frequencies(signal, sampling_rate):
         list: estimated formant frequencies in Hz
     """
     n_coeffs = 2 + sampling_rate // 1000
-    a = lfilter(np.ones(n_coeffs), [1], signal)
+    # librosa.lpc (Burg's method) gives an order-n_coeffs polynomial, so np.roots stays tiny
+    a = librosa.lpc(np.asarray(signal, dtype=np.float64), order=n_coeffs)
     roots = np.roots(a)
     roots = [r for r in roots if np.imag(r) >= 0]
     angles = np.angle(roots)
@@ -167,7 +399,7 @@ def formant_frequencies(signal, sampling_rate):
 
 def fft_based_downsampling(signal, original_rate, target_rate):
     """
-    Downsample a signal using FFT-based low-pass filtering
+    Downsample a signal using polyphase anti-aliasing filtering
 
     Args:
         signal (ndarray): input signal
@@ -177,18 +409,13 @@ def fft_based_downsampling(signal, original_rate, target_rate):
     Returns:
         ndarray: downsampled signal
     """
-    fft_signal = np.fft.rfft(signal)
-    frequencies = np.fft.rfftfreq(len(signal), d=1 / original_rate)
-    cutoff = target_rate / 2
-    fft_signal[frequencies > cutoff] = 0
-    filtered_signal = np.fft.irfft(fft_signal)
-    downsampled_signal = filtered_signal[::original_rate // target_rate]
-    return downsampled_signal
+    # Polyphase FIR resampling handles any rational ratio without a full-length FFT buffer
+    return resample_poly(signal, int(target_rate), int(original_rate))
 
 
 def harmonics_to_noise_ratio(signal, original_rate, target_rate=11025, frame_size=1024, hop_size=512):
     """
-    Compute the Harmonics-to-Noise Ratio (HNR) of a signal using FFT-based downsampling
+    Compute the Harmonics-to-Noise Ratio (HNR) of a signal after downsampling it to target_rate
 
     Args:
         signal (ndarray): the input signal (mono)
@@ -201,18 +428,16 @@ def harmonics_to_noise_ratio(signal, original_rate, target_rate=11025, frame_siz
         float: average HNR across all frames in dB
     """
     downsampled_signal = fft_based_downsampling(signal, original_rate, target_rate)
-    hnr_values = []
-
-    for frame_index in range(0, len(downsampled_signal) - frame_size, hop_size):
-        frame = downsampled_signal[frame_index:frame_index + frame_size]
-        autocorr = np.correlate(frame, frame, mode='full')[len(frame) - 1:]
-        harmonic_energy = np.max(autocorr)
-        noise_energy = np.mean(np.abs(autocorr[1:]))
-        if harmonic_energy > 0 and noise_energy > 0:
-            hnr = 10 * np.log10(harmonic_energy / (noise_energy + 1e-6))
-        else:
-            hnr = np.nan
-        hnr_values.append(hnr)
-
-    hnr_values = [hnr for hnr in hnr_values if not np.isnan(hnr)]
-    return np.mean(hnr_values) if hnr_values else np.nan
+    frames = _frame_signal(downsampled_signal, frame_size, hop_size)
+
+    # Autocorrelate every frame with a single batched FFT over the frame matrix
+    n_fft = sfft.next_fast_len(2 * frame_size - 1, real=True)
+    spectrum = sfft.rfft(frames, n=n_fft, axis=1)
+    autocorr = sfft.irfft(spectrum * np.conj(spectrum), n=n_fft, axis=1)[:, :frame_size]
+    harmonic_energy = np.max(autocorr, axis=1, initial=0.0)
+    noise_energy = np.mean(np.abs(autocorr[:, 1:]), axis=1)
+
+    # Only frames with positive harmonic and noise energy contribute
+    valid = (harmonic_energy > 0) & (noise_energy > 0)
+    hnr_values = 10 * np.log10(harmonic_energy[valid] / (noise_energy[valid] + 1e-6))
+    return hnr_values.mean() if hnr_values.size else np.nan
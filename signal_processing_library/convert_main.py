@@ -1,5 +1,5 @@
 import sys
-from input.convert import audio_to_csv, convert_csv_to_wav, convert_csv_to_mp3
+from input.convert import audio_to_csv, audio_to_npz, convert_csv_to_wav, convert_csv_to_mp3
 
 
 def main():
@@ -8,9 +8,10 @@ def main():
     print("1. Convert audio to CSV")
     print("2. Convert CSV to WAV")
     print("3. Convert CSV to MP3")
+    print("4. Convert audio to NPZ")
 
     try:
-        choice = int(input("Enter your choice (1/2/3): "))
+        choice = int(input("Enter your choice (1/2/3/4): "))
         if choice == 1:
             input_path = input("Enter the path of the audio file: ")
             output_path = input("Enter the path to save the CSV file: ")
@@ -24,8 +25,13 @@ def main():
             input_path = input("Enter the path of the CSV file: ")
             output_path = input("Enter the path to save the MP3 file: ")
             convert_csv_to_mp3(input_path, output_path)
+        elif choice == 4:
+            input_path = input("Enter the path of the audio file: ")
+            output_path = input("Enter the path to save the NPZ file: ")
+            file_type = input("Enter the audio file type ('wav' or 'mp3'): ").lower()
+            audio_to_npz(input_path, output_path, file_type)
         else:
-            print("Invalid choice. Please enter 1, 2, or 3.")
+            print("Invalid choice. Please enter 1, 2, 3, or 4.")
     except Exception as e:
         print(f"An error occurred: {e}")
         sys.exit(1)
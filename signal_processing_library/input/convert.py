@@ -6,19 +6,28 @@ from scipy.io.wavfile import write
 import librosa
 from pathlib import Path
 from pydub import AudioSegment
+from input.file_loader import read_csv
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional, pandas' C parser is used without it
+    pa_csv = None
 
-def audio_to_csv(input_path, output_path, file_type='wav'):
+# Rows parsed per chunk when integer samples are read with pandas
+_CSV_CHUNK_ROWS = 1 << 20
+
+
+def _read_audio(input_path, file_type):
     """
-    Convert an audio file (.wav or .mp3) to a CSV file
+    Read the samples of a WAV or MP3 file
 
     Args:
         input_path (str): path to the input audio file
-        output_path (str): path to save the output CSV file
-        file_type (str): type of the audio file ('wav' or 'mp3'). Default is 'wav'
+        file_type (str): type of the audio file ('wav' or 'mp3')
 
     Returns:
-        None
+        tuple: (sampling_rate, signal)
     """
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"The file '{input_path}' does not exist.")
@@ -32,21 +41,140 @@ def audio_to_csv(input_path, output_path, file_type='wav'):
     else:
         raise ValueError(f"Unsupported file type '{file_type}'. Supported types are 'wav' and 'mp3'.")
 
+    return sampling_rate, signal
+
+
+def audio_to_csv(input_path, output_path, file_type='wav'):
+    """
+    Convert an audio file (.wav or .mp3) to a CSV file
+
+    CSV is convenient for inspecting samples by hand but is large and slow to
+    parse; use audio_to_npz for anything that will be loaded again.
+
+    Args:
+        input_path (str): path to the input audio file
+        output_path (str): path to save the output CSV file
+        file_type (str): type of the audio file ('wav' or 'mp3'). Default is 'wav'
+
+    Returns:
+        None
+    """
+    sampling_rate, signal = _read_audio(input_path, file_type)
+
     # Convert signal to DataFrame
     if signal.ndim == 1:  # Mono
         df = pd.DataFrame(signal, columns=["Mono"])
     else:  # Stereo
         df = pd.DataFrame(signal, columns=["Left", "Right"])
 
-    # Add metadata columns
+    # Add metadata column (sample times are derivable from the sampling rate)
     df['Sampling Rate'] = sampling_rate
-    df['Time (s)'] = np.arange(len(signal)) / sampling_rate
 
     # Save to CSV
     df.to_csv(output_path, index=False)
     print(f"CSV saved at {output_path}")
 
 
+def audio_to_npz(input_path, output_path, file_type='wav'):
+    """
+    Convert an audio file (.wav or .mp3) to a NumPy .npz archive
+
+    The samples are stored in binary with their original dtype, so the file is
+    several times smaller than the CSV equivalent and loads without parsing.
+    load_audio scales integer PCM from the archive to float in [-1, 1), as it
+    does for WAV files, so both give the same metrics.
+
+    Args:
+        input_path (str): path to the input audio file
+        output_path (str): path to save the output .npz file
+        file_type (str): type of the audio file ('wav' or 'mp3'). Default is 'wav'
+
+    Returns:
+        None
+    """
+    sampling_rate, signal = _read_audio(input_path, file_type)
+
+    np.savez(output_path, signal=signal, sampling_rate=sampling_rate)
+    print(f"NPZ saved at {output_path}")
+
+
+def _to_int16(samples):
+    """
+    Narrow integer samples to int16, rejecting values that don't fit
+
+    Args:
+        samples (ndarray): integer samples
+
+    Returns:
+        ndarray: int16 samples
+    """
+    info = np.iinfo(np.int16)
+    if samples.size and (samples.min() < info.min or samples.max() > info.max):
+        raise ValueError(f"CSV samples must fit in int16 (16-bit PCM), got values outside [{info.min}, {info.max}].")
+    return samples.astype(np.int16)
+
+
+def _read_csv_signal(input_csv_path):
+    """
+    Read the samples and sampling rate from a CSV file produced by audio_to_csv
+
+    Integer sample columns (exported from 16-bit PCM) are parsed into int16:
+    directly by pyarrow.csv when pyarrow is installed, otherwise by pandas' C
+    parser one chunk of rows at a time, so only that chunk is held widened.
+    Samples outside the int16 range raise ValueError. Float columns are read
+    as float and cast afterwards.
+
+    Args:
+        input_csv_path (str): path to the input CSV file
+
+    Returns:
+        tuple: (sampling_rate, signal)
+    """
+    # Sniff the columns, their type and the sampling rate from the first row only
+    header = pd.read_csv(input_csv_path, nrows=1)
+    if 'Sampling Rate' not in header.columns:
+        raise ValueError("CSV file must contain a 'Sampling Rate' column.")
+    if 'Mono' in header.columns:
+        channels = ['Mono']
+    elif 'Left' in header.columns and 'Right' in header.columns:
+        channels = ['Left', 'Right']
+    else:
+        raise ValueError("CSV file must contain 'Mono' or 'Left' and 'Right' columns.")
+
+    # Extract sampling rate
+    sampling_rate = int(header['Sampling Rate'].iloc[0])  # Assuming uniform sampling rate
+    print(f"Detected sampling rate: {sampling_rate} Hz")
+
+    if all(pd.api.types.is_integer_dtype(header[channel]) for channel in channels):
+        if pa_csv is not None:
+            try:
+                table = pa_csv.read_csv(
+                    input_csv_path,
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={channel: pa.int16() for channel in channels},
+                        include_columns=channels,
+                    ),
+                )
+            except pa.ArrowInvalid as e:
+                raise ValueError(f"CSV samples must fit in int16 (16-bit PCM): {e}") from e
+            signal = np.column_stack([table.column(channel).to_numpy() for channel in channels])
+        else:
+            # pandas would silently wrap values outside int16, so range-check each chunk before narrowing it
+            chunks = [
+                _to_int16(chunk[channels].to_numpy())
+                for chunk in pd.read_csv(input_csv_path, usecols=channels, chunksize=_CSV_CHUNK_ROWS)
+            ]
+            signal = np.concatenate(chunks) if chunks else np.empty((0, len(channels)), dtype=np.int16)
+    else:
+        df = read_csv(input_csv_path, usecols=channels)
+        signal = df[channels].to_numpy()
+
+    # Extract audio data (a single column for mono, (samples, 2) for stereo)
+    if len(channels) == 1:
+        signal = signal[:, 0]
+    return sampling_rate, signal.astype(np.int16, copy=False)
+
+
 def convert_csv_to_wav(input_csv_path, output_wav_path):
     """
     Convert a CSV file containing audio data to a WAV file
@@ -60,25 +188,11 @@ def convert_csv_to_wav(input_csv_path, output_wav_path):
     """
     # Read the CSV file
     print(f"Reading CSV file: {input_csv_path}")
-    df = pd.read_csv(input_csv_path)
-
-    # Extract audio data
-    if "Mono" in df.columns:
-        signal = df["Mono"].to_numpy()
-    elif "Left" in df.columns and "Right" in df.columns:
-        left = df["Left"].to_numpy()
-        right = df["Right"].to_numpy()
-        signal = np.column_stack((left, right))  # Combine for stereo
-    else:
-        raise ValueError("CSV file must contain 'Mono' or 'Left' and 'Right' columns.")
-
-    # Extract sampling rate
-    sampling_rate = int(df["Sampling Rate"].iloc[0])  # Assuming uniform sampling rate
-    print(f"Detected sampling rate: {sampling_rate} Hz")
+    sampling_rate, signal = _read_csv_signal(input_csv_path)
 
     # Write to WAV file
     print(f"Converting CSV to WAV: {output_wav_path}")
-    write(output_wav_path, sampling_rate, signal.astype(np.int16))
+    write(output_wav_path, sampling_rate, signal)
     print(f"WAV file saved successfully at {output_wav_path}")
 
 
@@ -93,40 +207,18 @@ def convert_csv_to_mp3(input_csv_path, output_mp3_path):
     Returns:
         None
     """
-    # Temporary WAV file path
-    temp_wav_path = "temp.wav"
-
-    try:
-        print(f"Reading CSV file: {input_csv_path}")
-        df = pd.read_csv(input_csv_path)
-
-        # Ensure the necessary columns exist
-        if 'Sampling Rate' not in df.columns or ('Mono' not in df.columns and 'Left' not in df.columns):
-            raise ValueError("CSV file must contain 'Sampling Rate' and audio data columns ('Mono', 'Left', or 'Right').")
-
-        # Extract sampling rate
-        sampling_rate = int(df['Sampling Rate'].iloc[0])
-        print(f"Detected sampling rate: {sampling_rate} Hz")
-
-        # Prepare signal
-        if 'Mono' in df.columns:
-            signal = df['Mono'].values
-        else:
-            signal = df[['Left', 'Right']].values
-
-        # Save signal as WAV for now
-        print(f"Converting CSV to WAV: {temp_wav_path}")
-        write(temp_wav_path, sampling_rate, signal.astype(np.int16))
-
-        # Convert WAV to MP3
-        print(f"Converting WAV to MP3: {output_mp3_path}")
-        audio = AudioSegment.from_wav(temp_wav_path)
-        audio.export(output_mp3_path, format="mp3")
-        print(f"MP3 file saved successfully at {output_mp3_path}")
-
-    finally:
-        # Cleanup the temporary WAV file
-        import os
-        if os.path.exists(temp_wav_path):
-            os.remove(temp_wav_path)
-
+    print(f"Reading CSV file: {input_csv_path}")
+    sampling_rate, pcm = _read_csv_signal(input_csv_path)
+
+    # Build the segment straight from interleaved 16-bit PCM, no intermediate WAV file
+    audio = AudioSegment(
+        pcm.tobytes(),
+        frame_rate=sampling_rate,
+        sample_width=pcm.dtype.itemsize,
+        channels=1 if pcm.ndim == 1 else pcm.shape[1],
+    )
+
+    # Convert to MP3
+    print(f"Converting to MP3: {output_mp3_path}")
+    audio.export(output_mp3_path, format="mp3")
+    print(f"MP3 file saved successfully at {output_mp3_path}")
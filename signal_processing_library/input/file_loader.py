@@ -2,11 +2,75 @@ import os
 import librosa
 import pandas as pd
 import numpy as np
+from scipy.io import wavfile
+
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:  # pyarrow is optional, pandas' C parser is used without it
+    _CSV_ENGINE = 'c'
+
+# Columns written by audio_to_csv that hold metadata rather than samples
+_CSV_METADATA_COLUMNS = ('Sampling Rate', 'Time (s)')
+
+
+def read_csv(input_csv_path, **kwargs):
+    """
+    Read a CSV file produced by audio_to_csv, using the multi-threaded pyarrow parser when available
+
+    Args:
+        input_csv_path (str): path to the input CSV file
+        **kwargs: extra arguments forwarded to pandas.read_csv
+
+    Returns:
+        DataFrame: the CSV contents
+    """
+    return pd.read_csv(input_csv_path, engine=_CSV_ENGINE, **kwargs)
+
+
+def _pcm_to_float(signal):
+    """
+    Scale integer PCM samples to float32 in [-1, 1), the same way librosa.load does
+
+    Args:
+        signal (ndarray): samples; floating-point input is returned unchanged
+
+    Returns:
+        ndarray: floating-point signal
+    """
+    if signal.dtype == np.uint8:
+        # 8-bit WAV is unsigned with its midpoint at 128
+        signal = np.subtract(signal, 128, dtype=np.float32)
+        signal *= 1.0 / 128
+    elif np.issubdtype(signal.dtype, np.integer):
+        scale = 1.0 / (1 << (8 * signal.dtype.itemsize - 1))
+        signal = np.multiply(signal, scale, dtype=np.float32)
+    return signal
+
+
+def _read_wav(file_path):
+    """
+    Read a WAV file through a memory map, scaling integer PCM to float32 in [-1, 1)
+
+    The map lets integer PCM be scaled straight from the file into a single float32
+    array instead of first being read into an integer copy. Float WAVs are copied out
+    of the map so the returned array doesn't keep the file open.
+
+    Args:
+        file_path (str): path to the WAV file
+
+    Returns:
+        tuple: (sampling_rate, signal)
+    """
+    sampling_rate, signal = wavfile.read(file_path, mmap=True)
+    if np.issubdtype(signal.dtype, np.floating):
+        return sampling_rate, np.array(signal)
+    return sampling_rate, _pcm_to_float(signal)
 
 
 def load_audio(file_path):
     """
-    Load an audio file (WAV, MP3, or CSV)
+    Load an audio file (WAV, MP3, CSV, or NPZ)
 
     Args:
         file_path (str): path to the audio file
@@ -20,14 +84,20 @@ def load_audio(file_path):
     file_extension = os.path.splitext(file_path)[1].lower()
 
     if file_extension in ['.wav', '.mp3']:
-        # Load WAV or MP3 using librosa
         try:
-            signal, sampling_rate = librosa.load(file_path, sr=None, mono=False)
-            # Convert stereo signals to separate channels
-            if signal.ndim == 1:
-                signal = signal  # Mono
-            elif signal.ndim == 2:
-                signal = signal.T  # Stereo
+            signal = None
+            if file_extension == '.wav':
+                # Read WAV through a memory map, converting it to float32 in one pass
+                try:
+                    sampling_rate, signal = _read_wav(file_path)
+                except ValueError:
+                    pass  # Layout scipy can't memory-map (e.g. 24-bit PCM), use librosa below
+            if signal is None:
+                # Load MP3 (or unmappable WAV) using librosa
+                signal, sampling_rate = librosa.load(file_path, sr=None, mono=False)
+                # Convert stereo signals to separate channels
+                if signal.ndim == 2:
+                    signal = signal.T  # Stereo
         except Exception as e:
             raise ValueError(f"Error loading audio file: {e}")
 
@@ -39,12 +109,15 @@ def load_audio(file_path):
     elif file_extension == '.csv':
         # Load CSV using pandas
         try:
-            df = pd.read_csv(file_path)
-            # Check required columns
-            if 'Sampling Rate' not in df.columns or 'Time (s)' not in df.columns:
-                raise ValueError("CSV must contain 'Sampling Rate' and 'Time (s)' columns.")
-            signal = df.drop(columns=['Sampling Rate', 'Time (s)']).to_numpy()
-            sampling_rate = df['Sampling Rate'].iloc[0]
+            # Sniff the header and sampling rate from the first row only
+            header = pd.read_csv(file_path, nrows=1)
+            # Check required columns ('Time (s)' is only present in older CSV exports)
+            if 'Sampling Rate' not in header.columns:
+                raise ValueError("CSV must contain a 'Sampling Rate' column.")
+            sampling_rate = header['Sampling Rate'].iloc[0]
+            # Parse just the sample columns
+            channels = [column for column in header.columns if column not in _CSV_METADATA_COLUMNS]
+            signal = read_csv(file_path, usecols=channels).to_numpy()
         except Exception as e:
             raise ValueError(f"Error loading CSV file: {e}")
 
@@ -53,6 +126,20 @@ def load_audio(file_path):
         print(f"Sampling rate: {sampling_rate} Hz")
         return sampling_rate, signal
 
+    elif file_extension == '.npz':
+        # Load binary archive written by audio_to_npz, scaling PCM like the WAV branch
+        try:
+            with np.load(file_path) as archive:
+                signal = _pcm_to_float(archive['signal'])
+                sampling_rate = int(archive['sampling_rate'])
+        except Exception as e:
+            raise ValueError(f"Error loading NPZ file: {e}")
+
+        print(f"Loaded file: {file_path}")
+        print(f"Signal length: {signal.shape[0]} samples")
+        print(f"Sampling rate: {sampling_rate} Hz")
+        return sampling_rate, signal
+
     else:
         raise ValueError(f"Unsupported file format: {file_extension}")
 
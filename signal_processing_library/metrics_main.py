@@ -1,10 +1,14 @@
-import time
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scipy import fft as sfft
 from input.file_loader import load_audio, get_signal_metadata
 from processing.preprocess import normalize_signal, lowpass_filter
 from processing.advanced_filters import dynamic_range_compression
 from transformations.fft import compute_fft
 from visualizations.plots import plot_time_domain, plot_frequency_domain, plot_spectrogram
 from analysis.feature_extraction import (
+    compute_snr,
     short_term_energy,
     zero_crossing_rate,
     spectral_centroid,
@@ -13,30 +17,46 @@ from analysis.feature_extraction import (
     harmonics_to_noise_ratio,
 )
 
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # threadpoolctl is optional, BLAS thread pools are left as-is without it
+    threadpool_limits = None
+
+
+def _init_worker():
+    """
+    Limit each worker process to one BLAS/OpenMP thread so the pool doesn't oversubscribe the CPUs
+    """
+    if threadpool_limits is not None:
+        threadpool_limits(1)
 
-def main():
-    try:
-        file_path = input("Enter the path of the file to analyze: ")
 
-        # Load the signal
-        sampling_rate, signal = load_audio(file_path)
+def analyze_file(file_path, plot=False):
+    """
+    Load an audio file and compute its metrics
 
-        # Print metadata
-        metadata = get_signal_metadata(sampling_rate, signal)
-        for key, value in metadata.items():
-            print(f"  {key}: {value}")
+    Args:
+        file_path (str): path to the audio file
+        plot (bool): show time-domain, frequency-domain and spectrogram plots
 
-        normalized_signal = normalize_signal(signal)
-        filtered_signal = lowpass_filter(normalized_signal, cutoff=1000, sampling_rate=sampling_rate)
+    Returns:
+        dict: signal metadata and computed metrics
+    """
+    # Load the signal
+    sampling_rate, signal = load_audio(file_path)
+    metadata = get_signal_metadata(sampling_rate, signal)
 
-        # Compute and display Signal-to-Noise Ratio
-        noise = 0.01 * np.random.randn(len(normalized_signal))
-        snr = compute_snr(normalized_signal, noise)
-        print(f"Signal-to-Noise Ratio: {snr:.2f} dB")
+    normalized_signal = normalize_signal(signal)
+    filtered_signal = lowpass_filter(normalized_signal, cutoff=1000, sampling_rate=sampling_rate)
 
-        # Apply dynamic range compression and get plots
-        compressed_signal = dynamic_range_compression(filtered_signal, threshold=0.5, ratio=4)
+    # Signal-to-Noise Ratio
+    noise = 0.01 * np.random.randn(len(normalized_signal))
+    snr = compute_snr(normalized_signal, noise)
 
+    # Apply dynamic range compression and get plots
+    compressed_signal = dynamic_range_compression(filtered_signal, threshold=0.5, ratio=4)
+
+    if plot:
         print("\n")
         plot_time_domain(compressed_signal, sampling_rate, title=f"Compressed Signal (Amplitude vs Time) - {file_path}")
 
@@ -48,40 +68,96 @@ def main():
         print("\n")
         plot_spectrogram(filtered_signal, sampling_rate, title=f"Spectrogram of Filtered Signal - {file_path}")
 
-        # Testing speech analysis features
-        if signal.ndim == 2:  # Convert to mono if necessary
-            mean_signal = np.mean(signal, axis=1)
-        else:
-            mean_signal = signal
-
-        print("\n")
+    # Speech analysis features
+    if signal.ndim == 2:  # Convert to mono if necessary
+        mean_signal = np.mean(signal, axis=1)
+    else:
+        mean_signal = signal
+
+    frame_size = int(0.02 * sampling_rate)  # 20ms frames
+    hop_size = int(0.01 * sampling_rate)  # 10ms hop
+
+    # Spectral centroid and rolloff share a single FFT of the signal
+    spectrum = compute_fft(mean_signal, sampling_rate)
+
+    downsampled_signal = mean_signal[::8]
+
+    return {
+        "metadata": metadata,
+        "snr": snr,
+        "short_term_energy": short_term_energy(mean_signal, frame_size, hop_size),
+        "zero_crossing_rate": zero_crossing_rate(mean_signal, frame_size, hop_size),
+        "spectral_centroid": spectral_centroid(mean_signal, sampling_rate, spectrum=spectrum),
+        "spectral_rolloff": spectral_rolloff(mean_signal, sampling_rate, spectrum=spectrum),
+        "mfccs": compute_mfcc(mean_signal, sampling_rate),
+        "hnr": harmonics_to_noise_ratio(downsampled_signal, original_rate=sampling_rate, target_rate=sampling_rate // 8),
+    }
+
+
+def print_results(file_path, results):
+    """
+    Print the metrics returned by analyze_file
+
+    Args:
+        file_path (str): path of the analyzed file
+        results (dict): output of analyze_file
+    """
+    print(f"\nResults for {file_path}:")
+    for key, value in results["metadata"].items():
+        print(f"  {key}: {value}")
+    print(f"Signal-to-Noise Ratio: {results['snr']:.2f} dB")
+    print(f"Short-term Energy (First 10 Values): {results['short_term_energy'][:10]}")
+    print(f"Zero-Crossing Rate (First 10 Values): {results['zero_crossing_rate'][:10]}")
+    print(f"Spectral Centroid: {results['spectral_centroid']:.2f} Hz")
+    print(f"Spectral Rolloff: {results['spectral_rolloff']:.2f} Hz")
+    print(f"MFCCs (Shape): {results['mfccs'].shape}")
+    print(f"Harmonics-to-Noise Ratio (HNR): {results['hnr']:.2f} dB")
+
+
+def analyze_files(file_paths, max_workers=None):
+    """
+    Analyze several audio files in parallel, one process per file
+
+    Args:
+        file_paths (list): paths to the audio files
+        max_workers (int): maximum number of worker processes (default: number of CPUs)
+
+    Returns:
+        list: (file_path, results or exception) pairs in input order
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(analyze_file, file_path) for file_path in file_paths]
+        outcomes = []
+        for file_path, future in zip(file_paths, futures):
+            try:
+                outcomes.append((file_path, future.result()))
+            except Exception as e:
+                outcomes.append((file_path, e))
+    return outcomes
 
-        # Short-term energy
-        frame_size = int(0.02 * sampling_rate)  # 20ms frames
-        hop_size = int(0.01 * sampling_rate)  # 10ms hop
-        energy = short_term_energy(mean_signal, frame_size, hop_size)
-        print(f"Short-term Energy (First 10 Values): {energy[:10]}")
 
-        # Zero-crossing rate
-        zcr = zero_crossing_rate(mean_signal, frame_size, hop_size)
-        print(f"Zero-Crossing Rate (First 10 Values): {zcr[:10]}")
-
-        # Spectral centroid
-        centroid = spectral_centroid(mean_signal, sampling_rate)
-        print(f"Spectral Centroid: {centroid:.2f} Hz")
-
-        # Spectral rolloff
-        rolloff = spectral_rolloff(mean_signal, sampling_rate)
-        print(f"Spectral Rolloff: {rolloff:.2f} Hz")
-
-        # MFCC computation
-        mfccs = compute_mfcc(mean_signal, sampling_rate)
-        print(f"MFCCs (Shape): {mfccs.shape}")
-
-        # Harmonics-to-noise ratio
-        downsampled_signal = mean_signal[::8]
-        hnr = harmonics_to_noise_ratio(downsampled_signal, original_rate=sampling_rate, target_rate=sampling_rate // 8)
-        print(f"Harmonics-to-Noise Ratio (HNR): {hnr:.2f} dB")
+def main():
+    try:
+        # Paths can be given on the command line, otherwise prompt for them
+        file_paths = sys.argv[1:]
+        if not file_paths:
+            entered = input("Enter the path of the file(s) to analyze (comma-separated): ")
+            file_paths = [path.strip() for path in entered.split(",") if path.strip()]
+        if not file_paths:
+            raise ValueError("no files given")
+
+        if len(file_paths) == 1:
+            # Single file: analyze in-process so the plots can be shown, with FFTs using every core
+            with sfft.set_workers(-1):
+                results = analyze_file(file_paths[0], plot=True)
+            print_results(file_paths[0], results)
+            return
+
+        for file_path, outcome in analyze_files(file_paths):
+            if isinstance(outcome, Exception):
+                print(f"An error occurred while analyzing '{file_path}': {outcome}")
+            else:
+                print_results(file_path, outcome)
 
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -1,8 +1,9 @@
-from scipy.signal import butter, lfilter
+from scipy.signal import sosfilt, sosfiltfilt
 import numpy as np
+from processing.preprocess import design_butter
 
 
-def highpass_filter(signal, cutoff, sampling_rate, order=5):
+def highpass_filter(signal, cutoff, sampling_rate, order=5, zero_phase=False):
     """
     Apply a high-pass filter to the signal
 
@@ -11,17 +12,20 @@ def highpass_filter(signal, cutoff, sampling_rate, order=5):
         cutoff (float): the cutoff frequency in Hz
         sampling_rate (int): the sampling rate of the signal in Hz
         order (int): the order of the filter
+        zero_phase (bool): filter forwards and backwards to cancel the phase shift
 
     Returns:
         ndarray: high-pass filtered signal
     """
     nyquist = 0.5 * sampling_rate
     normal_cutoff = cutoff / nyquist
-    b, a = butter(order, normal_cutoff, btype='high', analog=False)
-    return lfilter(b, a, signal)
+    sos = design_butter(order, (float(normal_cutoff),), 'high')
+    if zero_phase:
+        return sosfiltfilt(sos, signal)
+    return sosfilt(sos, signal)
 
 
-def bandpass_filter(signal, low_cutoff, high_cutoff, sampling_rate, order=5):
+def bandpass_filter(signal, low_cutoff, high_cutoff, sampling_rate, order=5, zero_phase=False):
     """
     Apply a band-pass filter to the signal
 
@@ -31,6 +35,7 @@ def bandpass_filter(signal, low_cutoff, high_cutoff, sampling_rate, order=5):
         high_cutoff (float): The high cutoff frequency in Hz
         sampling_rate (int): The sampling rate of the signal in Hz
         order (int): the order of the filter
+        zero_phase (bool): filter forwards and backwards to cancel the phase shift
 
     Returns:
         ndarray: band-pass filtered signal
@@ -38,8 +43,10 @@ def bandpass_filter(signal, low_cutoff, high_cutoff, sampling_rate, order=5):
     nyquist = 0.5 * sampling_rate
     low = low_cutoff / nyquist
     high = high_cutoff / nyquist
-    b, a = butter(order, [low, high], btype='band', analog=False)
-    return lfilter(b, a, signal)
+    sos = design_butter(order, (float(low), float(high)), 'band')
+    if zero_phase:
+        return sosfiltfilt(sos, signal)
+    return sosfilt(sos, signal)
 
 
 def dynamic_range_compression(signal, threshold=0.5, ratio=4):
@@ -54,7 +61,13 @@ def dynamic_range_compression(signal, threshold=0.5, ratio=4):
     Returns:
         ndarray: compressed signal
     """
-    compressed_signal = np.copy(signal)
-    mask = np.abs(signal) > threshold
-    compressed_signal[mask] = threshold + (signal[mask] - threshold) / ratio
-    return compressed_signal
+    signal = np.asarray(signal)
+    if not np.issubdtype(signal.dtype, np.floating):
+        signal = signal.astype(np.float64)  # Integer input; float input keeps its dtype (no copy)
+    # Branchless: shrink the part of each sample's magnitude above threshold by 1/ratio
+    excess = np.abs(signal)
+    np.subtract(excess, threshold, out=excess)
+    np.maximum(excess, 0, out=excess)
+    np.multiply(excess, 1 - 1 / ratio, out=excess)
+    np.copysign(excess, signal, out=excess)
+    return np.subtract(signal, excess, out=excess)
@@ -1,5 +1,40 @@
+from functools import lru_cache
 import numpy as np
-from scipy.signal import butter, lfilter
+from scipy.signal import butter, sosfilt, sosfiltfilt
+
+
+@lru_cache(maxsize=64)
+def _butter_sos(order, wn, btype):
+    """
+    Design a digital Butterworth filter, memoized on its parameters.
+
+    Args:
+        order (int): The order of the filter.
+        wn (tuple): Normalized cutoff frequency (or (low, high) band edges).
+        btype (str): The filter type ('low', 'high' or 'band').
+
+    Returns:
+        ndarray: Read-only second-order sections of the filter.
+    """
+    cutoff = wn[0] if len(wn) == 1 else list(wn)
+    sos = butter(order, cutoff, btype=btype, analog=False, output='sos')
+    sos.flags.writeable = False  # Shared between callers through the cache
+    return sos
+
+def design_butter(order, wn, btype):
+    """
+    Design a digital Butterworth filter, reusing the memoized design.
+
+    Args:
+        order (int): The order of the filter.
+        wn (tuple): Normalized cutoff frequency (or (low, high) band edges).
+        btype (str): The filter type ('low', 'high' or 'band').
+
+    Returns:
+        ndarray: Second-order sections of the filter, as a copy the caller may
+        modify (sosfilt also rejects read-only arrays).
+    """
+    return _butter_sos(order, wn, btype).copy()
 
 def normalize_signal(signal):
     """
@@ -9,11 +44,16 @@ def normalize_signal(signal):
         signal (ndarray): The input signal.
 
     Returns:
-        ndarray: Normalized signal.
+        ndarray: Normalized signal. A silent (all-zero) signal is returned as a
+        float array of zeros, since it has no peak to scale by.
     """
-    return signal / np.max(np.abs(signal))
+    # Peak magnitude from min/max reductions, without a full-length np.abs temporary
+    peak = max(-float(np.min(signal)), float(np.max(signal)))
+    if peak == 0:
+        return np.zeros(np.shape(signal))
+    return signal * (1.0 / peak)
 
-def lowpass_filter(signal, cutoff, sampling_rate, order=5):
+def lowpass_filter(signal, cutoff, sampling_rate, order=5, zero_phase=False):
     """
     Apply a low-pass filter to the signal.
 
@@ -22,11 +62,14 @@ def lowpass_filter(signal, cutoff, sampling_rate, order=5):
         cutoff (float): The cutoff frequency in Hz.
         sampling_rate (int): The sampling rate of the signal in Hz.
         order (int): The order of the filter.
+        zero_phase (bool): Filter forwards and backwards to cancel the phase shift.
 
     Returns:
         ndarray: Filtered signal.
     """
     nyquist = 0.5 * sampling_rate
     normal_cutoff = cutoff / nyquist
-    b, a = butter(order, normal_cutoff, btype='low', analog=False)
-    return lfilter(b, a, signal)
+    sos = design_butter(order, (float(normal_cutoff),), 'low')
+    if zero_phase:
+        return sosfiltfilt(sos, signal)
+    return sosfilt(sos, signal)
@@ -1,7 +1,27 @@
+from functools import lru_cache
 import numpy as np
+from scipy import fft as sfft
 from scipy.signal import find_peaks
 
 
+@lru_cache(maxsize=2)
+def _rfftfreq(n, sampling_rate):
+    """
+    Frequency bins of an n-point real FFT, memoized since they depend only on (n, sampling_rate).
+    Each entry is as long as a whole signal, so only the most recent lengths are kept
+
+    Args:
+        n (int): FFT length
+        sampling_rate (int): the sampling rate of the signal in Hz
+
+    Returns:
+        ndarray: read-only array of frequency bins in Hz
+    """
+    freqs = sfft.rfftfreq(n, d=1 / sampling_rate)
+    freqs.flags.writeable = False  # Shared between callers through the cache
+    return freqs
+
+
 def compute_fft(signal, sampling_rate):
     """
     Compute the Fast Fourier Transform (FFT) of the signal
@@ -17,9 +37,10 @@ def compute_fft(signal, sampling_rate):
     if signal.ndim == 2:
         signal = signal[:, 0]  # Use the first channel for stereo signals
 
+    # No zero-padding: it would smear leakage across bins and shift spectral features
     n = len(signal)
-    freqs = np.fft.rfftfreq(n, d=1 / sampling_rate)  # Frequency bins
-    fft_values = np.abs(np.fft.rfft(signal))  # Magnitude of FFT
+    freqs = _rfftfreq(n, sampling_rate)  # Frequency bins
+    fft_values = np.abs(sfft.rfft(signal))  # Magnitude of FFT
     return freqs, fft_values
 
 